@@ -1,17 +1,37 @@
 #!/usr/bin/env python3
 import argparse
+import atexit
+import concurrent.futures
+import json
 import os
 import pathlib
+import queue
 import re
-import subprocess
+import socket
 import sys
+import threading
 import time
-from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
-from playwright.sync_api import Playwright, sync_playwright, TimeoutError as PWTimeoutError
+from playwright.sync_api import Playwright, sync_playwright
 
 PROFILE_URL = "https://www.naukri.com/mnjuser/profile?id=&altresid"
+UPDATE_RESUME_RX = re.compile(r"update resume", re.I)
+LOGIN_RX = re.compile(r"login|submit", re.I)
+OTP_RX = re.compile(r"OTP|one[- ]time password", re.I)
+POST_LOGIN_URL_RX = re.compile(r"mnjuser|homepage|profile")
+LOGOUT_RX = re.compile(r"logout", re.I)
+SUCCESS_RX = re.compile(r"uploaded\s+on|resume uploaded successfully|success", re.I)
+
+# Requests the uploader never needs; aborting them lets networkidle settle quickly
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+BLOCKED_URL_PARTS = ("doubleclick", "googletagmanager", "google-analytics", "facebook", "hotjar", "clarity.ms")
+
+RESUME_EXTS = {".pdf", ".doc", ".docx", ".rtf"}
+
+# Notifications shell out to osascript; run them off the upload path and flush at exit
+_NOTIFY_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="notify")
+atexit.register(_NOTIFY_POOL.shutdown)
 
 
 def info(msg: str) -> None:
@@ -26,8 +46,9 @@ def err(msg: str) -> None:
     print(f"[ERROR] {msg}", file=sys.stderr)
 
 
-def mac_notify(title: str, message: str) -> None:
-    """Best-effort macOS user notification via AppleScript."""
+def _do_mac_notify(title: str, message: str) -> None:
+    import subprocess
+
     try:
         safe_title = title.replace('"', '\\"')
         safe_msg = message.replace('"', '\\"')
@@ -39,7 +60,35 @@ def mac_notify(title: str, message: str) -> None:
         pass
 
 
-def email_notify(to_address: str, subject: str, body: str) -> None:
+def _send_via_sendmail(to_address: str, subject: str, body: str) -> bool:
+    # Hand the message straight to a configured MTA, skipping AppleScript and Mail.app.
+    # Stock macOS sendmail queues mail locally without a relay, so it's opt-in only.
+    import shutil
+    import subprocess
+    from email.message import EmailMessage
+
+    sendmail = shutil.which("msmtp")
+    if not sendmail and os.environ.get("NAUKRI_USE_SENDMAIL") == "1":
+        sendmail = shutil.which("sendmail")
+    if not sendmail:
+        return False
+    try:
+        msg = EmailMessage()
+        msg["To"] = to_address
+        msg["Subject"] = subject
+        msg.set_content(body)
+        proc = subprocess.Popen([sendmail, "-t"], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        proc.communicate(msg.as_bytes(), timeout=30)
+        return proc.returncode == 0
+    except Exception:
+        return False
+
+
+def _do_email_notify(to_address: str, subject: str, body: str) -> None:
+    import subprocess
+
+    if _send_via_sendmail(to_address, subject, body):
+        return
     try:
         def esc(s: str) -> str:
             return s.replace("\\", "\\\\").replace("\"", r"\"")
@@ -58,22 +107,14 @@ def email_notify(to_address: str, subject: str, body: str) -> None:
         pass
 
 
-def setup_session(playwright: Playwright, storage_path: pathlib.Path) -> None:
-    info("Launching Chromium in headed mode for initial login…")
-    browser = playwright.chromium.launch(headless=False, slow_mo=200)
-    context = browser.new_context()
-    page = context.new_page()
-
-    page.goto(PROFILE_URL, wait_until="load")
-    info("Please complete login/OTP in the browser window.")
-    input("Press Enter here after the page shows your profile…")
+def mac_notify(title: str, message: str) -> None:
+    """Best-effort macOS user notification via AppleScript, sent in the background."""
+    _NOTIFY_POOL.submit(_do_mac_notify, title, message)
 
-    # Save cookies/localStorage for future runs
-    context.storage_state(path=str(storage_path))
-    info(f"Saved session to {storage_path}")
 
-    context.close()
-    browser.close()
+def email_notify(to_address: str, subject: str, body: str) -> None:
+    """Best-effort email via msmtp (or opted-in sendmail, else Mail.app), sent in the background."""
+    _NOTIFY_POOL.submit(_do_email_notify, to_address, subject, body)
 
 
 def setup_session_auto(playwright: Playwright, storage_path: pathlib.Path, timeout_sec: int = 600) -> int:
@@ -81,23 +122,16 @@ def setup_session_auto(playwright: Playwright, storage_path: pathlib.Path, timeo
     browser = playwright.chromium.launch(headless=False)
     context = browser.new_context()
     page = context.new_page()
-    page.goto(PROFILE_URL, wait_until="load")
+    page.goto(PROFILE_URL, wait_until="domcontentloaded")
     info("In the browser, log in and complete OTP/CAPTCHA. I will save the session once your profile loads.")
 
-    deadline = time.time() + timeout_sec
-    success = False
-    while time.time() < deadline:
-        try:
-            page.wait_for_load_state("networkidle", timeout=2000)
-        except Exception:
-            pass
-        try:
-            page.get_by_role("button", name=re.compile("update resume", re.I)).wait_for(timeout=2000)
-            success = True
-            break
-        except Exception:
-            pass
-        time.sleep(1)
+    # Let the browser watch for the profile's button rather than polling from Python
+    try:
+        page.get_by_role("button", name=UPDATE_RESUME_RX).wait_for(timeout=timeout_sec * 1000)
+        success = True
+    except Exception:
+        # Timed out, or the user closed the login window
+        success = False
 
     if success:
         context.storage_state(path=str(storage_path))
@@ -107,7 +141,10 @@ def setup_session_auto(playwright: Playwright, storage_path: pathlib.Path, timeo
         err("Timed out waiting for profile page. Session not saved.")
         rc = 1
 
-    context.close(); browser.close()
+    try:
+        context.close(); browser.close()
+    except Exception:
+        pass
     return rc
 
 
@@ -144,6 +181,8 @@ def with_context(playwright: Playwright, storage_path: pathlib.Path, headless: b
 
     # If running in background mode (headed but hidden), try to hide the Chromium window
     if stealth_headed and not headless:
+        import subprocess
+
         try:
             for proc in ("Chromium", "Google Chrome"):
                 subprocess.run([
@@ -156,7 +195,24 @@ def with_context(playwright: Playwright, storage_path: pathlib.Path, headless: b
     return browser, context
 
 
+def _block_noise(route, request) -> None:
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(p in request.url for p in BLOCKED_URL_PARTS):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def block_noise(context) -> None:
+    # Headless runs only: skip ads, trackers and media the upload flow never touches
+    try:
+        context.route("**/*", _block_noise)
+    except Exception:
+        pass
+
+
 def get_keychain_secret(service: str, account: Optional[str] = None) -> Optional[str]:
+    import subprocess
+
     try:
         cmd = ["security", "find-generic-password"]
         if account:
@@ -173,54 +229,40 @@ def get_keychain_secret(service: str, account: Optional[str] = None) -> Optional
         return None
 
 
+def _fill_first(page, selectors, value: str) -> bool:
+    for sel in selectors:
+        loc = page.locator(sel)
+        if loc.count() > 0:
+            try:
+                loc.first.fill(value)
+                return True
+            except Exception:
+                pass
+    return False
+
+
 def attempt_login(page, username: str, password: str) -> bool:
     # Navigate to login page explicitly to avoid dynamic redirects
     page.goto("https://www.naukri.com/nlogin/login", wait_until="load")
 
-    # Fill email
+    # Each entry is one CSS union, so a single round-trip probes every variant.
+    # The bare text input stays a separate fallback: unions match in document
+    # order and it could otherwise win over the real email field.
     email_selectors = [
-        'input[name="email"]',
-        'input[name="emailId"]',
-        'input#eLoginNew',
-        'input[placeholder*="Email"]',
-        'input[placeholder*="Username"]',
-        'input[type="text"]'
+        'input[name="email"], input[name="emailId"], input#eLoginNew, '
+        'input[placeholder*="Email"], input[placeholder*="Username"]',
+        'input[type="text"]',
     ]
-    filled = False
-    for sel in email_selectors:
-        loc = page.locator(sel)
-        if loc.count() > 0:
-            try:
-                loc.first.fill(username)
-                filled = True
-                break
-            except Exception:
-                pass
-    if not filled:
+    if not _fill_first(page, email_selectors, username):
         return False
 
-    # Fill password
-    pwd_selectors = [
-        'input[name="password"]',
-        'input#pwd1',
-        'input[type="password"]'
-    ]
-    pfilled = False
-    for sel in pwd_selectors:
-        loc = page.locator(sel)
-        if loc.count() > 0:
-            try:
-                loc.first.fill(password)
-                pfilled = True
-                break
-            except Exception:
-                pass
-    if not pfilled:
+    pwd_selectors = ['input[name="password"], input#pwd1, input[type="password"]']
+    if not _fill_first(page, pwd_selectors, password):
         return False
 
     # Click login
     try:
-        page.get_by_role("button", name=re.compile("login|submit", re.I)).click(timeout=5000)
+        page.get_by_role("button", name=LOGIN_RX).click(timeout=5000)
     except Exception:
         try:
             page.locator('button:has-text("Login")').first.click(timeout=5000)
@@ -231,77 +273,118 @@ def attempt_login(page, username: str, password: str) -> bool:
             except Exception:
                 return False
 
-    # Wait for either profile or OTP
+    # Wait for the post-login redirect (or give the OTP prompt time to render)
     try:
-        page.wait_for_load_state("networkidle", timeout=15000)
+        page.wait_for_url(POST_LOGIN_URL_RX, timeout=15000)
     except Exception:
         pass
 
-    content = ""
+    # Visible text is much smaller than the serialized DOM and is all we need to spot an OTP prompt
+    text = ""
     try:
-        content = page.content()
+        text = page.locator("body").inner_text()
     except Exception:
         pass
 
-    if re.search(r"OTP", content, re.I) or re.search(r"one[- ]time password", content, re.I):
+    if OTP_RX.search(text):
         # OTP required; cannot proceed non-interactively
         return False
 
-    # Heuristic: if we can see Update resume or profile avatar, consider logged-in
+    # Heuristic: if we can see Update resume or profile avatar, consider logged-in.
+    # Login usually lands on the homepage; only skip navigation if it's already the profile.
     try:
-        page.goto(PROFILE_URL, wait_until="load", timeout=60000)
+        open_profile(page)
     except Exception:
         pass
 
     try:
-        page.get_by_role("button", name=re.compile("update resume", re.I)).wait_for(timeout=5000)
+        page.get_by_role("button", name=UPDATE_RESUME_RX).wait_for(timeout=5000)
         return True
     except Exception:
         # Fallback to checking if logout link or user menu is present
         try:
-            if re.search(r"logout", page.content(), re.I):
+            if page.locator('a[href*="logout" i]').or_(page.get_by_text(LOGOUT_RX)).count() > 0:
                 return True
         except Exception:
             pass
         return False
 
 
-def try_set_file_via_input(page, file_path: str) -> bool:
-    # Try common strategies to find the file input
-    candidates = [
-        'input[type="file"]',
-        'input[type=file]'
-    ]
-    for sel in candidates:
-        loc = page.locator(sel)
-        try:
-            if loc.count() > 0:
-                loc.first.set_input_files(file_path)
-                return True
-        except PWTimeoutError:
-            pass
-        except Exception:
-            pass
-    return False
+def _wait_for_upload_control(page) -> bool:
+    # One wait covers both strategies: returns as soon as the file input or the button is attached
+    try:
+        page.locator('input[type="file"]').or_(page.get_by_role("button", name=UPDATE_RESUME_RX)).first.wait_for(state="attached", timeout=5000)
+        return True
+    except Exception:
+        return False
+
+
+def start_upload(page, file_path: str, chooser_timeout: int = 10000) -> bool:
+    if not _wait_for_upload_control(page):
+        return False
+    # Prefer the file input (works even if it's hidden); the button may itself be an <input type="button">
+    file_input = page.locator('input[type="file"]')
+    try:
+        if file_input.count() > 0:
+            file_input.first.set_input_files(file_path)
+            return True
+    except Exception:
+        pass
+    try:
+        with page.expect_file_chooser(timeout=chooser_timeout) as fc_info:
+            page.get_by_role("button", name=UPDATE_RESUME_RX).first.click()
+        fc_info.value.set_files(file_path)
+        return True
+    except Exception:
+        return False
+
+
+def wait_for_upload_success(page, timeout: int) -> bool:
+    # The browser polls the visible text itself, so Python sleeps until a toast/label
+    # shows up anywhere on the page or the wait times out
+    try:
+        page.wait_for_function(
+            "p => new RegExp(p, 'i').test(document.body ? document.body.innerText : '')",
+            arg=SUCCESS_RX.pattern,
+            timeout=timeout,
+        )
+        return True
+    except Exception:
+        return False
+
+
+def open_profile(page) -> None:
+    # Avoid a full reload when we're already on the profile (e.g. after login)
+    if not page.url.startswith(PROFILE_URL.split("?")[0]):
+        page.goto(PROFILE_URL, wait_until="domcontentloaded", timeout=60000)
+    else:
+        page.wait_for_load_state("domcontentloaded", timeout=5000)
 
 
 def resolve_resume_path(resume_path: pathlib.Path) -> Optional[pathlib.Path]:
     if resume_path.is_file():
         return resume_path
     if resume_path.is_dir():
-        exts = {".pdf", ".doc", ".docx", ".rtf"}
+        # Single pass for the most recently modified; is_file() comes from the listing, so only
+        # matching resume files cost a stat() call
+        best = None
+        best_mtime = -1.0
         try:
-            files = [p for p in resume_path.iterdir() if p.is_file() and p.suffix.lower() in exts]
+            with os.scandir(resume_path) as it:
+                for entry in it:
+                    if entry.is_file() and os.path.splitext(entry.name)[1].lower() in RESUME_EXTS:
+                        mtime = entry.stat().st_mtime
+                        if mtime > best_mtime:
+                            best_mtime = mtime
+                            best = pathlib.Path(entry.path)
         except PermissionError:
             # Propagate as None; caller will notify with context
             return None
         except Exception:
             return None
-        if not files:
+        if best is None:
             return None
-        # Pick the most recently modified
-        files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        return files[0]
+        return best
     return None
 
 
@@ -321,26 +404,15 @@ def upload_resume(playwright: Playwright, storage_path: pathlib.Path, resume_pat
         return 2
 
     browser, context = with_context(playwright, storage_path, headless=not headed, stealth_headed=background, engine=engine)
+    if not headed:
+        block_noise(context)
     page = context.new_page()
 
     info("Opening profile page…")
-    page.goto(PROFILE_URL, wait_until="load", timeout=60000)
+    open_profile(page)
 
-    # Try direct file input first (works even if input is hidden)
-    info("Attempting to set the file on the hidden input…")
-    tried_upload = False
-    if try_set_file_via_input(page, str(target)):
-        tried_upload = True
-    else:
-        info("Falling back to clicking the Update resume button and using file chooser…")
-        try:
-            with page.expect_file_chooser(timeout=10000) as fc_info:
-                page.get_by_role("button", name=re.compile("update resume", re.I)).click()
-            chooser = fc_info.value
-            chooser.set_files(str(target))
-            tried_upload = True
-        except Exception:
-            tried_upload = False
+    info("Looking for the resume upload control…")
+    tried_upload = start_upload(page, str(target))
 
     # If we couldn't start an upload, we may not be logged in. Try credential login if available.
     if not tried_upload:
@@ -354,20 +426,10 @@ def upload_resume(playwright: Playwright, storage_path: pathlib.Path, resume_pat
                 # Re-open profile and try upload again
                 info("Retrying upload after login…")
                 try:
-                    page.goto(PROFILE_URL, wait_until="load", timeout=60000)
+                    open_profile(page)
                 except Exception:
                     pass
-                if try_set_file_via_input(page, str(target)):
-                    tried_upload = True
-                else:
-                    try:
-                        with page.expect_file_chooser(timeout=10000) as fc_info:
-                            page.get_by_role("button", name=re.compile("update resume", re.I)).click()
-                        chooser = fc_info.value
-                        chooser.set_files(str(target))
-                        tried_upload = True
-                    except Exception:
-                        tried_upload = False
+                tried_upload = start_upload(page, str(target))
         if not tried_upload:
             err("Could not access upload controls. You may need to re-run --setup or the site layout changed.")
             mac_notify("Naukri uploader failed", "Could not access upload controls. Try re-running setup.")
@@ -380,38 +442,12 @@ def upload_resume(playwright: Playwright, storage_path: pathlib.Path, resume_pat
             return 3
 
     # Wait for upload completion indicators
-    success = False
-    indicators = [
-        re.compile(r"uploaded\s+on", re.I),
-        re.compile(r"resume uploaded successfully", re.I),
-        re.compile(r"success", re.I),
-    ]
     try:
         page.wait_for_load_state("networkidle", timeout=15000)
     except Exception:
         pass
 
-    # Scan page content heuristically
-    try:
-        content = page.content()
-        for rx in indicators:
-            if rx.search(content):
-                success = True
-                break
-    except Exception:
-        pass
-
-    if not success:
-        # Try to find a toast or label dynamically for a few seconds
-        for _ in range(10):
-            try:
-                content = page.content()
-                if any(rx.search(content) for rx in indicators):
-                    success = True
-                    break
-            except Exception:
-                pass
-            time.sleep(1)
+    success = wait_for_upload_success(page, timeout=10000)
 
     if success:
         info("Resume upload appears to have succeeded.")
@@ -437,46 +473,196 @@ def upload_resume(playwright: Playwright, storage_path: pathlib.Path, resume_pat
     return rc
 
 
-def attempt_upload_with_engine(pw: Playwright, storage_path: pathlib.Path, resume_path: pathlib.Path, engine: str) -> int:
-    # Run headless with given engine; returns rc like upload_resume
-    browser, context = with_context(pw, storage_path, headless=True, stealth_headed=False, engine=engine)
+def upload_in_context(context, resume_path: pathlib.Path, stop: Optional[threading.Event] = None, claim: Optional[threading.Lock] = None) -> int:
+    # Upload on a fresh page of an existing context; returns rc like upload_resume.
+    # When racing engines, `claim` lets only one of them upload at a time and `stop`
+    # is set as soon as a file has been submitted, confirmed or not, so the other
+    # engine bails out instead of uploading again.
     page = context.new_page()
+    claimed = False
     try:
-        page.goto(PROFILE_URL, wait_until="load", timeout=60000)
-        if not try_set_file_via_input(page, str(resume_path)):
-            try:
-                with page.expect_file_chooser(timeout=8000) as fc_info:
-                    page.get_by_role("button", name=re.compile("update resume", re.I)).click()
-                chooser = fc_info.value
-                chooser.set_files(str(resume_path))
-            except Exception:
-                context.close(); browser.close(); return 3
-        page.wait_for_load_state("networkidle", timeout=10000)
-        content = page.content()
-        if re.search(r"uploaded\s+on|success", content, re.I):
-            context.close(); browser.close(); return 0
-        # brief retry scan
-        for _ in range(5):
-            time.sleep(1)
-            try:
-                content = page.content()
-                if re.search(r"uploaded\s+on|success", content, re.I):
-                    context.close(); browser.close(); return 0
-            except Exception:
-                pass
-        context.close(); browser.close(); return 1
+        open_profile(page)
+        if claim is not None:
+            claim.acquire()
+            claimed = True
+        if stop is not None and stop.is_set():
+            return 1
+        if not start_upload(page, str(resume_path), chooser_timeout=8000):
+            return 3
+        if stop is not None:
+            stop.set()
+        try:
+            page.wait_for_load_state("networkidle", timeout=10000)
+        except Exception:
+            pass
+        return 0 if wait_for_upload_success(page, timeout=15000) else 1
     except Exception:
+        return 3
+    finally:
+        if claimed:
+            claim.release()
+        try:
+            page.close()
+        except Exception:
+            pass
+
+
+def attempt_upload_with_engine(pw: Playwright, storage_path: pathlib.Path, resume_path: pathlib.Path, engine: str, stop: Optional[threading.Event] = None, claim: Optional[threading.Lock] = None) -> int:
+    # Run headless with given engine; returns rc like upload_resume
+    if stop is not None and stop.is_set():
+        return 1
+    browser, context = with_context(pw, storage_path, headless=True, stealth_headed=False, engine=engine)
+    block_noise(context)
+    try:
+        return upload_in_context(context, resume_path, stop=stop, claim=claim)
+    finally:
         try:
             context.close(); browser.close()
         except Exception:
             pass
+
+
+def attempt_upload_in_thread(storage_path: pathlib.Path, resume_path: pathlib.Path, engine: str, stop: threading.Event, claim: threading.Lock) -> int:
+    # Playwright objects can't cross threads, so each worker drives its own instance
+    try:
+        with sync_playwright() as pw:
+            return attempt_upload_with_engine(pw, storage_path, resume_path, engine, stop=stop, claim=claim)
+    except Exception:
         return 3
 
 
+def race_headless_engines(storage_path: pathlib.Path, resume_path: pathlib.Path) -> int:
+    # Race WebKit and Chromium headless; the first success wins
+    engines = ("webkit", "chromium")
+    stop = threading.Event()
+    claim = threading.Lock()
+    results: "queue.Queue[Tuple[str, int]]" = queue.Queue()
+
+    def run(engine: str) -> None:
+        results.put((engine, attempt_upload_in_thread(storage_path, resume_path, engine, stop, claim)))
+
+    # Daemon threads so a slow losing engine (up to a 60 s goto) doesn't hold up exit;
+    # its Playwright driver shuts down with its browser when our process goes away.
+    for engine in engines:
+        threading.Thread(target=run, args=(engine,), name=f"upload-{engine}", daemon=True).start()
+    for _ in engines:
+        engine, rc = results.get()
+        if rc == 0:
+            engine_name = "WebKit" if engine == "webkit" else "Chromium"
+            mac_notify("Naukri uploader succeeded", f"Headless {engine_name} upload done")
+            return 0
+        if stop.is_set():
+            # This engine submitted the file; the other one won't upload, so don't wait for it
+            break
+    if stop.is_set():
+        # A file was submitted but the page never confirmed it
+        mac_notify("Naukri uploader warning", "Upload not confirmed. Please verify on Naukri.")
+    else:
+        mac_notify("Naukri uploader warning", "Headless engines failed; consider enabling --background")
+    return 1
+
+
+def serve_daemon(pw: Playwright, storage_path: pathlib.Path, socket_path: pathlib.Path, engine: str = "chromium") -> int:
+    """Keep one headless browser context alive and serve upload requests over a UNIX socket."""
+    # Check for a live daemon before paying for a browser launch
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        probe = _connect_daemon(socket_path)
+        if probe is not None:
+            probe.close()
+            err(f"Another daemon is already listening on {socket_path}")
+            return 1
+        # Stale socket left behind by a daemon that didn't shut down cleanly
+        socket_path.unlink()
+    browser, context = with_context(pw, storage_path, headless=True, stealth_headed=False, engine=engine)
+    block_noise(context)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.listen(1)
+    info(f"Daemon listening on {socket_path}")
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                # A client that never sends a full line mustn't wedge this single-threaded loop
+                conn.settimeout(10)
+                try:
+                    line = conn.makefile("r").readline()
+                except OSError:
+                    line = ""
+                if not line:
+                    # Liveness probe, stalled client, or client gave up before sending anything
+                    continue
+                try:
+                    request = json.loads(line)
+                    # Only upload resume files, whatever path a local client sends
+                    target = resolve_resume_path(pathlib.Path(request["resume_path"]))
+                    if not target or target.suffix.lower() not in RESUME_EXTS:
+                        err(f"Resume not accessible/found at: {request['resume_path']}")
+                        rc = 2
+                    else:
+                        info(f"Uploading {target}…")
+                        rc = upload_in_context(context, target)
+                except Exception:
+                    rc = 3
+                if rc == 0:
+                    # Keep the on-disk session fresh for one-shot runs
+                    try:
+                        context.storage_state(path=str(storage_path))
+                    except Exception:
+                        pass
+                info(f"Upload finished with rc={rc}")
+                try:
+                    conn.sendall(json.dumps({"rc": rc}).encode() + b"\n")
+                except Exception:
+                    pass
+    except KeyboardInterrupt:
+        info("Stopping daemon…")
+    finally:
+        server.close()
+        try:
+            socket_path.unlink()
+        except Exception:
+            pass
+        context.close(); browser.close()
+    return 0
+
+
+def _connect_daemon(socket_path: pathlib.Path) -> Optional[socket.socket]:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+        return sock
+    except OSError:
+        sock.close()
+        return None
+
+
+def request_daemon_upload(socket_path: pathlib.Path, resume_path: pathlib.Path) -> Optional[int]:
+    """Ask a running daemon to upload; returns None only if no daemon is reachable."""
+    if not socket_path.exists():
+        return None
+    sock = _connect_daemon(socket_path)
+    if sock is None:
+        return None
+    # From here on the daemon owns the upload; never fall back to a second one-shot run
+    with sock:
+        try:
+            sock.settimeout(180)
+            sock.sendall(json.dumps({"resume_path": str(resume_path)}).encode() + b"\n")
+            reply = sock.makefile("r").readline()
+            return int(json.loads(reply)["rc"])
+        except Exception:
+            warn("Lost contact with the daemon; the upload may still have gone through.")
+            return 1
+
+
 def main():
     parser = argparse.ArgumentParser(description="Naukri resume uploader")
-    parser.add_argument("--setup", action="store_true", help="Run interactive login and save session state (press Enter to confirm)")
+    parser.add_argument("--setup", action="store_true", help="Alias for --setup-auto")
     parser.add_argument("--setup-auto", action="store_true", help="Open a browser and auto-detect login success (no terminal input)")
+    parser.add_argument("--daemon", action="store_true", help="Keep a headless browser running and serve uploads over --socket")
+    parser.add_argument("--socket", default=str(pathlib.Path.home() / "naukri_job" / "uploader.sock"), help="UNIX socket used by --daemon; one-shot runs hand off to a running daemon if present")
     parser.add_argument("--resume-path", default=str(pathlib.Path.home() / "naukri_job" / "resume"), help="Path to the resume file or folder (pdf/doc/docx/rtf). If a folder is provided, the most recently modified supported file is used.")
     parser.add_argument("--storage", default=str(pathlib.Path.home() / "naukri_job" / "storage_state.json"), help="Path to storage_state file")
     parser.add_argument("--headed", action="store_true", help="Run with a visible browser window")
@@ -492,6 +678,28 @@ def main():
     args = parser.parse_args()
     storage_path = pathlib.Path(args.storage)
     resume_path = pathlib.Path(args.resume_path)
+    socket_path = pathlib.Path(args.socket)
+
+    # Hand off to a running daemon to skip launching a browser
+    # (auto engine only: explicit engines keep their own browser plus the login retry and emails)
+    if not (args.daemon or args.setup or args.setup_auto or args.headed or args.background) and args.engine == "auto":
+        # The daemon resolves the path itself, so send it absolute
+        rc = request_daemon_upload(socket_path, resume_path.absolute())
+        if rc is not None:
+            if rc == 0:
+                mac_notify("Naukri uploader succeeded", "Daemon upload done")
+            else:
+                mac_notify("Naukri uploader warning", "Daemon upload not confirmed. Please verify on Naukri.")
+            return rc
+
+    # Automatic engine selection to keep background truly headless. Each engine
+    # runs its own driver in a worker thread, so don't start one here as well.
+    if not (args.daemon or args.setup or args.setup_auto or args.headed or args.background) and args.engine == "auto":
+        target = resolve_resume_path(resume_path)
+        if not target:
+            err(f"Resume not accessible/found at: {args.resume_path}")
+            return 2
+        return race_headless_engines(storage_path, target)
 
     # Resolve password: env var first, then Keychain service
     password = os.environ.get(args.password_env)
@@ -499,31 +707,11 @@ def main():
         password = get_keychain_secret(args.password_keychain_service, account=args.username)
 
     with sync_playwright() as pw:
-        if args.setup:
-            setup_session(pw, storage_path)
-            return 0
-        if args.setup_auto:
+        if args.daemon:
+            return serve_daemon(pw, storage_path, socket_path, engine=("chromium" if args.engine == "auto" else args.engine))
+        if args.setup or args.setup_auto:
             return setup_session_auto(pw, storage_path)
         else:
-            # Automatic engine selection to keep background truly headless
-            if not args.headed and not args.background and args.engine == "auto":
-                target = resolve_resume_path(pathlib.Path(args.resume_path))
-                if not target:
-                    err(f"Resume not accessible/found at: {args.resume_path}")
-                    return 2
-                # Try WebKit headless first, then Chromium headless
-                with sync_playwright() as pw2:
-                    rc = attempt_upload_with_engine(pw2, storage_path, target, engine="webkit")
-                    if rc == 0:
-                        mac_notify("Naukri uploader succeeded", "Headless WebKit upload done")
-                        return 0
-                    rc = attempt_upload_with_engine(pw2, storage_path, target, engine="chromium")
-                    if rc == 0:
-                        mac_notify("Naukri uploader succeeded", "Headless Chromium upload done")
-                        return 0
-                    mac_notify("Naukri uploader warning", "Headless engines failed; consider enabling --background")
-                    return 1
-            # Otherwise follow normal path
             return upload_resume(
                 pw,
                 storage_path,